@@ -0,0 +1,111 @@
+// Loads the pre-computed map (built by src/convert_data.py) into the covid-map Div. The
+// figure holds one date; the per-date values ship once as typed matrices and
+// the slider and play button restyle only z and customdata, without the server.
+(function() {
+    var FIGURE_URL = 'assets/covid_map.json.gz';
+    var FRAME_INTERVAL = 100;
+    var LOAD_TIMEOUT = 30000;
+
+    // The static file handler serves the .json.gz with Content-Encoding: gzip,
+    // so the browser has already decompressed the body
+    function loadPayload() {
+        return fetch(FIGURE_URL).then(function(response) {
+            if (!response.ok) {
+                throw new Error('Failed to load ' + FIGURE_URL + ': HTTP ' + response.status);
+            }
+            return response.json();
+        });
+    }
+
+    function decodeMatrix(encoded, ArrayType) {
+        var binary = atob(encoded);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new ArrayType(bytes.buffer);
+    }
+
+    // Dash renders the layout and loads assets/plotly.min.js asynchronously;
+    // give up (e.g. when src/convert_data.py was never run) after LOAD_TIMEOUT
+    function waitForGraph(callback, waited) {
+        waited = waited || 0;
+        var gd = document.getElementById('covid-map');
+        if (gd && window.Plotly) {
+            callback(gd);
+        } else if (waited >= LOAD_TIMEOUT) {
+            console.error('Could not load the COVID-19 map: ' +
+                          (gd ? 'plotly.js (assets/plotly.min.js) did not load'
+                              : 'the covid-map element was not rendered'));
+        } else {
+            setTimeout(function() { waitForGraph(callback, waited + 50); }, 50);
+        }
+    }
+
+    function setupMap(gd, payload) {
+        var n = payload.n_countries;
+        var nDates = payload.date_labels.length;
+        var z = decodeMatrix(payload.z, Int16Array);
+        var totalDeaths = decodeMatrix(payload.total_deaths, Float32Array);
+        var current = nDates - 1;
+        var timer = null;
+
+        // Total deaths are NaN where a country has no row for the date;
+        // format them like the Python side so the hover reads 'No data'
+        function formatTotalDeaths(values) {
+            var formatted = new Array(values.length);
+            for (var i = 0; i < values.length; i++) {
+                formatted[i] = isNaN(values[i]) ? 'No data'
+                                                : Math.round(values[i]).toLocaleString('en-US');
+            }
+            return formatted;
+        }
+
+        function showDate(index) {
+            if (index === current) {
+                return;
+            }
+            current = index;
+            Plotly.restyle(gd, {
+                z: [z.subarray(index * n, (index + 1) * n)],
+                customdata: [formatTotalDeaths(totalDeaths.subarray(index * n, (index + 1) * n))],
+                hovertemplate: payload.hovertemplate.replace('{date}', payload.date_labels[index])
+            }, [0]);
+        }
+
+        function step() {
+            var next = (current + 1) % nDates;
+            showDate(next);
+            Plotly.relayout(gd, {'sliders[0].active': next});
+        }
+
+        gd.on('plotly_sliderchange', function(event) {
+            showDate(event.slider.active);
+        });
+
+        gd.on('plotly_buttonclicked', function(event) {
+            var play = event.button.name === 'play';
+            if (play && timer === null) {
+                timer = setInterval(step, FRAME_INTERVAL);
+            } else if (!play && timer !== null) {
+                clearInterval(timer);
+                timer = null;
+            }
+        });
+    }
+
+    var payload = loadPayload();
+    waitForGraph(function(gd) {
+        payload.then(function(data) {
+            Plotly.newPlot(gd, {
+                data: data.figure.data,
+                layout: data.figure.layout,
+                config: {displayModeBar: false, scrollZoom: true, responsive: true}
+            }).then(function() {
+                setupMap(gd, data);
+            });
+        }).catch(function(error) {
+            console.error('Could not load the COVID-19 map:', error);
+        });
+    });
+})();
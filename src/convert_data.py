@@ -0,0 +1,285 @@
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+import plotly.offline
+import plotly.utils
+from types import MappingProxyType
+from collections.abc import Mapping
+import base64
+import gzip
+import json
+import os
+import urllib.request
+
+# Get the absolute path to the project root directory
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+csv_file_path = os.path.join(project_root, 'data', 'covid_data.csv')
+parquet_file_path = os.path.join(project_root, 'data', 'covid_data.parquet')
+geojson_file_path = os.path.join(project_root, 'data', 'countries.geojson')
+map_asset_path = os.path.join(project_root, 'assets', 'covid_map.json.gz')
+plotlyjs_asset_path = os.path.join(project_root, 'assets', 'plotly.min.js')
+
+# Natural Earth country borders, pinned to a release so the property names are
+# stable. Features are matched on ISO_A3_EH, the ISO 3166 code with Natural
+# Earth's exceptions filled in (ISO_A3 is -99 for e.g. France and Norway)
+geojson_url = 'https://raw.githubusercontent.com/nvkelso/natural-earth-vector/v5.1.2/geojson/ne_110m_admin_0_countries.geojson'
+
+# Only the columns the dashboard uses, with compact dtypes
+columns = [
+    'date', 'iso_code', 'continent', 'location',
+    'total_deaths', 'total_deaths_per_million'
+]
+dtypes = {
+    'iso_code': 'category',
+    'continent': 'category',
+    'location': 'category',
+    'total_deaths': 'float32',
+    'total_deaths_per_million': 'float32'
+}
+
+def freeze(value):
+    """Recursively wrap dicts in read-only mappings and lists in tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """Recursively copy a frozen setting into the plain dicts Plotly accepts"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+# Static figure settings, built once; frozen at every level so they cannot be
+# mutated by accident, and thawed into fresh copies when building the figure
+COLORSCALE = (
+    (0, '#ffffff'),
+    (0.1, '#fee5d9'),
+    (0.3, '#fcae91'),
+    (0.5, '#fb6a4a'),
+    (0.7, '#de2d26'),
+    (1.0, '#a50f15')
+)
+
+COLORBAR = freeze(dict(
+    title=dict(
+        text="Deaths per Million",
+        font=dict(size=12)
+    ),
+    thickness=15,
+    len=0.5,
+    x=1.0,
+    y=0.5,
+    yanchor='middle',
+    tickmode='array',
+    ticktext=('No data', '0', '1000', '2000', '3000', '4000'),
+    tickvals=(-1, 0, 1000, 2000, 3000, 4000),
+    tickfont=dict(size=10)
+))
+
+# WebGL map without a tile basemap; only the country polygons are drawn
+MAPBOX_LAYOUT = freeze(dict(
+    style='white-bg',
+    center=dict(lon=0, lat=20),
+    zoom=0.8
+))
+
+BASE_LAYOUT = freeze(dict(
+    # Leave room below the map for the date slider and play button
+    margin=dict(l=0, r=0, t=0, b=80),
+    paper_bgcolor='white',
+    plot_bgcolor='white',
+    hoverlabel=dict(
+        bgcolor="white",
+        font_size=14,
+        font_family="system-ui, -apple-system, sans-serif"
+    ),
+    # Enable smooth transitions
+    transition_duration=300
+))
+
+# Date slider styling; the steps are added per dataset
+SLIDER_STYLE = freeze(dict(
+    x=0.1,
+    len=0.85,
+    y=0,
+    pad=dict(t=10, b=10),
+    ticklen=0,
+    minorticklen=0,
+    font=dict(color='rgba(0, 0, 0, 0)'),
+    currentvalue=dict(prefix='Date: ', font=dict(size=14, color='#2c3e50'))
+))
+
+PLAY_BUTTONS = freeze(dict(
+    type='buttons',
+    direction='left',
+    x=0.1,
+    xanchor='right',
+    y=0,
+    yanchor='top',
+    pad=dict(t=10, r=10),
+    showactive=False,
+    buttons=(
+        dict(name='play', label='▶ Play', method='skip'),
+        dict(name='pause', label='⏸ Pause', method='skip')
+    )
+))
+
+# {date} is filled in per date, in Python for the initial figure and in the browser
+HOVERTEMPLATE = (
+    "<b>%{text}</b><br>" +
+    "Date: {date}<br>" +
+    "Deaths per Million: %{z:,.0f}<br>" +
+    "Total Deaths: %{customdata}" +
+    "<extra></extra>"
+)
+
+def format_total_deaths(values):
+    """Format one date's total deaths for the hover, with 'No data' for missing cells"""
+    return ['No data' if np.isnan(value) else f"{int(round(float(value))):,}" for value in values]
+
+def encode_matrix(matrix):
+    """Encode a numeric matrix as base64 little-endian bytes for the browser"""
+    return base64.b64encode(matrix.astype(matrix.dtype.newbyteorder('<')).tobytes()).decode('ascii')
+
+def build_figure(geojson, locations, names, z, total_deaths, date_label, slider_labels):
+    """Build the map figure showing a single date, with the date slider and play button"""
+    fig = go.Figure(
+        data=go.Choroplethmapbox(
+            geojson=geojson,
+            featureidkey='properties.ISO_A3_EH',
+            locations=locations,
+            text=names,
+            z=z,
+            customdata=format_total_deaths(total_deaths),
+            hovertemplate=HOVERTEMPLATE.replace('{date}', date_label),
+            colorscale=COLORSCALE,
+            colorbar=thaw(COLORBAR),
+            zmin=-1,
+            zmax=4000,
+            marker=dict(line=dict(color='#cccccc', width=0.5))
+        )
+    )
+    
+    # Slider steps and buttons only emit events; assets/covid_map.js restyles
+    # the z values for the selected date
+    fig.update_layout(
+        **thaw(BASE_LAYOUT),
+        mapbox=thaw(MAPBOX_LAYOUT),
+        sliders=[dict(
+            thaw(SLIDER_STYLE),
+            active=len(slider_labels) - 1,
+            steps=[dict(method='skip', label=label) for label in slider_labels]
+        )],
+        updatemenus=[thaw(PLAY_BUTTONS)]
+    )
+
+    return fig.to_plotly_json()
+
+def load_and_process_data():
+    """Load data and pre-compute the map figure plus per-date values"""
+    try:
+        print(f"Loading data from: {parquet_file_path}")
+        with open(geojson_file_path) as f:
+            geojson = json.load(f)
+        df = pd.read_parquet(parquet_file_path, columns=columns)
+        
+        # iso_code, continent and location come back as categories (small
+        # integer codes), since the Parquet file keeps the dtypes set above
+        df['total_deaths_per_million'] = df['total_deaths_per_million'].fillna(-1).astype('float32')
+        
+        # Filter data with a single mask so only one filtered copy is made
+        df = df.loc[(df['date'] <= '2024-06-17') &
+                    (df['continent'] != 'Antarctica') &
+                    df['iso_code'].notna()]
+        
+        # Keep all rows in one frame with a sorted DatetimeIndex; each date is a
+        # contiguous [start, end) range of rows
+        df = df.set_index('date').sort_index(kind='stable')
+        dates = df.index.unique()
+        starts = df.index.searchsorted(dates)
+        ends = np.r_[starts[1:], len(df)]
+        
+        # The same countries are drawn on every date, so the per-date values
+        # form a (date, country) matrix indexed by the iso_code category codes
+        iso_codes = df['iso_code'].cat.remove_unused_categories()
+        locations = iso_codes.cat.categories.to_numpy()
+        names = df['location'].groupby(iso_codes, observed=False).first().astype(str).to_numpy()
+        rows = np.repeat(np.arange(len(dates)), ends - starts)
+        country_idx = iso_codes.cat.codes.to_numpy()
+        
+        # Whole deaths per million fit in int16 (the color scale tops out at 4000)
+        # and keep -1 as the no-data sentinel, at half the bytes of float32
+        z = np.full((len(dates), len(locations)), -1, dtype='int16')
+        z[rows, country_idx] = np.clip(np.round(df['total_deaths_per_million'].to_numpy()), -1, 32767)
+        total_deaths = np.full((len(dates), len(locations)), np.nan, dtype='float32')
+        total_deaths[rows, country_idx] = df['total_deaths'].to_numpy()
+        
+        date_labels = dates.strftime('%B %d, %Y').tolist()
+        slider_labels = dates.strftime('%Y-%m-%d').tolist()
+        
+        return {
+            'figure': build_figure(geojson, locations, names, z[-1], total_deaths[-1],
+                                   date_labels[-1], slider_labels),
+            'hovertemplate': HOVERTEMPLATE,
+            'date_labels': date_labels,
+            'n_countries': len(locations),
+            'z': encode_matrix(z),
+            'total_deaths': encode_matrix(total_deaths)
+        }
+    except Exception as e:
+        print(f"Error in data loading: {e}")
+        raise
+
+def reject_constant(name):
+    """json.loads hook: fail on NaN/Infinity, which the browser's JSON parser rejects"""
+    raise ValueError(f"Map asset is not strict JSON: contains {name}")
+
+def write_map_asset(payload):
+    """Write the map payload as a gzipped static asset, replacing it atomically"""
+    # PlotlyJSONEncoder only maps NaN to null in encode(), which json.dumps
+    # uses; json.dump streams through iterencode() and would emit bare NaN
+    text = json.dumps(payload, cls=plotly.utils.PlotlyJSONEncoder)
+    json.loads(text, parse_constant=reject_constant)
+    
+    os.makedirs(os.path.dirname(map_asset_path), exist_ok=True)
+    tmp_path = map_asset_path + '.tmp'
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, map_asset_path)
+
+# Parquet keeps the dtypes, so re-running the build can skip CSV parsing;
+# an existing Parquet file is reused as-is when the CSV is not present
+if (not os.path.exists(parquet_file_path) or
+        (os.path.exists(csv_file_path) and
+         os.path.getmtime(parquet_file_path) < os.path.getmtime(csv_file_path))):
+    print(f"Reading CSV from: {csv_file_path}")
+    df = pd.read_csv(
+        csv_file_path,
+        engine='pyarrow',
+        usecols=columns,
+        dtype=dtypes,
+        parse_dates=['date']
+    )
+    df.to_parquet(parquet_file_path, compression='zstd', index=False)
+    print(f"Wrote {len(df)} rows to: {parquet_file_path}")
+
+# Country borders for the WebGL map
+if not os.path.exists(geojson_file_path):
+    print(f"Downloading country borders from: {geojson_url}")
+    urllib.request.urlretrieve(geojson_url, geojson_file_path)
+    print(f"Wrote country borders to: {geojson_file_path}")
+
+# The dashboard serves this file as-is and animates it in the browser
+# (assets/covid_map.js); re-run this script after changing the data or this code
+write_map_asset(load_and_process_data())
+print(f"Wrote map figure to: {map_asset_path}")
+
+# The map is drawn into a plain Div rather than dcc.Graph, so Dash does not load
+# plotly.js; serve the copy bundled with the installed plotly package
+with open(plotlyjs_asset_path, 'w', encoding='utf-8') as f:
+    f.write(plotly.offline.get_plotlyjs())
+print(f"Wrote plotly.js to: {plotlyjs_asset_path}")
@@ -1,7 +1,5 @@
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
 import os
 
 # Get the absolute path to the project root directory
@@ -10,57 +8,67 @@ data_file_path = os.path.join(project_root, 'data', 'covid_data.csv')
 
 print(f"Attempting to read data from: {data_file_path}")
 
-# Read the data
-df = pd.read_csv(data_file_path)
+# Read only the columns this figure uses
+df = pd.read_csv(data_file_path, usecols=[
+    'date', 'iso_code', 'location',
+    'total_cases', 'total_deaths', 'total_cases_per_million'
+])
 
-# Convert date strings to datetime objects
+# Convert date strings to datetime objects and index by date, so a
+# single date is a binary-search slice rather than a full-column scan
 df['date'] = pd.to_datetime(df['date'])
+df = df.set_index('date').sort_index()
 
-def format_number(value):
+def format_numbers(values):
     """
-    Helper function to format numbers, handling missing values gracefully.
+    Helper function to format a Series of numbers, handling missing values gracefully.
     Returns 'No data' for missing values, otherwise formats the number with commas.
     """
-    if pd.isna(value):
-        return 'No data'
-    return f"{int(value):,}"
+    formatted = (values.round().astype('Int64').astype(str)
+                 .str.replace(r'\B(?=(\d{3})+(?!\d))', ',', regex=True))
+    return formatted.where(values.notna(), 'No data')
 
 def prepare_choropleth_data(date, metric='total_cases_per_million'):
     """
     Prepare data for a specific date and metric, handling missing values.
+    Returns the rows for that date (a read-only selection) and their hover text.
     """
     # Filter data for the specific date
-    date_data = df[df['date'] == date].copy()
+    date_data = df.loc[date:date]
     
     # Create hover text with proper handling of missing values
-    date_data['hover_text'] = date_data.apply(
-        lambda x: f"""
-        Country: {x['location']}<br>
-        Total Cases: {format_number(x['total_cases'])}<br>
-        Total Deaths: {format_number(x['total_deaths'])}<br>
-        Cases per Million: {format_number(x[metric])}
-        """, axis=1)
+    hover_text = (
+        'Country: ' + date_data['location'] +
+        '<br>Total Cases: ' + format_numbers(date_data['total_cases']) +
+        '<br>Total Deaths: ' + format_numbers(date_data['total_deaths']) +
+        '<br>Cases per Million: ' + format_numbers(date_data[metric])
+    )
     
-    return date_data
+    return date_data, hover_text
 
 # Get the most recent date in our dataset
-latest_date = df['date'].max()
+latest_date = df.index.max()
 
 # Create the choropleth map
-date_data = prepare_choropleth_data(latest_date)
+date_data, hover_text = prepare_choropleth_data(latest_date)
+
+# Color scale range, computed once (95th percentile to handle outliers)
+cases_per_million = date_data['total_cases_per_million']
+zmid = cases_per_million.median()
+zmax = cases_per_million.quantile(0.95)
 
 # Create the figure using Plotly
 fig = go.Figure(data=go.Choropleth(
     locations=date_data['iso_code'],
     z=date_data['total_cases_per_million'],
-    text=date_data['hover_text'],
+    text=hover_text,
     colorscale='Reds',
     autocolorscale=False,
     colorbar_title="Cases per Million",
     # Add handling for missing values in the color scale
     zmin=0,
-    zmid=date_data['total_cases_per_million'].median(),
-    zmax=date_data['total_cases_per_million'].quantile(0.95),  # Using 95th percentile to handle outliers
+    zmid=zmid,
+    zmax=zmax,
 ))
 
 # Update the layout to match OWID style